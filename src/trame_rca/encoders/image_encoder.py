@@ -43,7 +43,10 @@ class RcaImageEncoder(Enum):
         cols: int,
         rows: int,
         quality: int,
+        bottom_up: bool = False,
     ) -> tuple[bytes, dict, int]:
         now_ms = int(time_ns() / 1000000)
         with profiler.timer(self._timer_msg):
-            return self._impl(np_image, self.value, cols, rows, quality, now_ms)
+            return self._impl(
+                np_image, self.value, cols, rows, quality, now_ms, bottom_up=bottom_up
+            )
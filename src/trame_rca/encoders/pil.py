@@ -18,6 +18,7 @@ def encode(
     rows: int,
     quality: int,
     now_ms: int,
+    bottom_up: bool = False,
 ) -> tuple[bytes, dict, int]:
     meta = dict(
         type=TO_IMAGE_TYPE[img_format],
@@ -30,7 +31,9 @@ def encode(
     )
 
     return (
-        encode_np_img_to_bytes(np_image, cols, rows, img_format, quality),
+        encode_np_img_to_bytes(
+            np_image, cols, rows, img_format, quality, bottom_up=bottom_up
+        ),
         meta,
         now_ms,
     )
@@ -42,11 +45,13 @@ def encode_np_img_to_bytes(
     rows: int,
     img_format: str,
     quality: int,
+    bottom_up: bool = False,
 ) -> bytes:
     """
     Numpy implementation of JPEG conversion of the input image.
     Input image should be a numpy array as extracted from the render to image function.
     This method uses numpy arrays as input for compatibility with Python's multiprocessing.
+    When bottom_up is True, the rows are flipped by PIL inside the encoding thread.
     """
 
     if not (cols and rows):
@@ -55,6 +60,8 @@ def encode_np_img_to_bytes(
     # t0 = time.time()
     fake_file = BytesIO()
     image = Image.fromarray(image)
+    if bottom_up:
+        image = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
     image.save(fake_file, TO_IMAGE_FORMAT[img_format], quality=quality)
     # t1 = time.time()
     # print(f"pill encode {t1-t0:.04f}s")
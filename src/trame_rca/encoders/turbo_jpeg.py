@@ -1,5 +1,5 @@
 from numpy.typing import NDArray
-from turbojpeg import TurboJPEG, TJPF_RGB
+from turbojpeg import TurboJPEG, TJFLAG_BOTTOMUP, TJPF_RGB
 from trame_rca.encoders.img import TO_IMAGE_TYPE
 # import time
 
@@ -13,6 +13,7 @@ def encode(
     rows: int,
     quality: int,
     now_ms: int,
+    bottom_up: bool = False,
 ) -> tuple[bytes, dict, int]:
     meta = dict(
         type=TO_IMAGE_TYPE[img_format],
@@ -25,7 +26,7 @@ def encode(
     )
 
     return (
-        encode_np_img_to_bytes(np_image, cols, rows, quality),
+        encode_np_img_to_bytes(np_image, cols, rows, quality, bottom_up=bottom_up),
         meta,
         now_ms,
     )
@@ -36,12 +37,18 @@ def encode_np_img_to_bytes(
     cols: int,
     rows: int,
     quality: int,
+    bottom_up: bool = False,
 ) -> bytes:
     if not (cols and rows):
         return b""
 
     # t0 = time.time()
-    result = jpeg.encode(image, quality=quality, pixel_format=TJPF_RGB)
+    result = jpeg.encode(
+        image,
+        quality=quality,
+        pixel_format=TJPF_RGB,
+        flags=TJFLAG_BOTTOMUP if bottom_up else 0,
+    )
     # t1 = time.time()
     # print(f"tubo-jpeg encode {t1-t0:.04f}s")
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import inspect
 import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from vtkmodules.vtkRenderingCore import vtkRenderWindow
 
+from .buffer_pool import CaptureBufferPool
 from .protocol import RemoteControlledAreaProtocol
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,7 @@ except ModuleNotFoundError as e:
     logger.info(e.msg)
 
 __all__ = [
+    "CaptureBufferPool",
     "RemoteControlledAreaProtocol",
     "VtkRemoteControlledArea",
     "window_wrapper",
@@ -24,7 +27,16 @@ __all__ = [
 def window_wrapper(
     window: RemoteControlledAreaProtocol | vtkRenderWindow,
 ) -> RemoteControlledAreaProtocol:
-    if isinstance(window, RemoteControlledAreaProtocol):
+    # isinstance() on the protocol would evaluate img_cols_rows (render + capture)
+    # on Python < 3.12, so look the members up statically instead.
+    if all(
+        inspect.getattr_static(window, name, None) is not None
+        for name in (
+            "img_cols_rows",
+            "process_resize_event",
+            "process_interaction_event",
+        )
+    ):
         return window
 
     from vtkmodules.vtkRenderingCore import vtkRenderWindow
@@ -0,0 +1,53 @@
+from collections import deque
+from threading import Lock
+
+import numpy as np
+from numpy.typing import NDArray
+from trame_common.utils import profiler
+
+
+class CaptureBufferPool:
+    """
+    Ring of preallocated capture buffers for a single view.
+
+    Buffers are handed out by :meth:`acquire` and come back through :meth:`release`
+    once their content is no longer needed (e.g. when the encoding is done).
+    A buffer that is never released is simply not reused. All the free buffers are
+    dropped when the requested shape changes, so reallocation only happens on resize.
+
+    :meth:`release` may be called from any thread.
+    """
+
+    def __init__(self, size: int = 4, dtype=np.uint8):
+        self._size = size
+        self._dtype = dtype
+        self._shape = None
+        self._free = deque()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict:
+        return dict(hits=self.hits, misses=self.misses, free=len(self._free))
+
+    def acquire(self, shape: tuple[int, ...]) -> NDArray:
+        shape = tuple(shape)
+        with self._lock:
+            if shape != self._shape:
+                self._shape = shape
+                self._free.clear()
+
+            if self._free:
+                self.hits += 1
+                return self._free.popleft()
+
+            self.misses += 1
+
+        profiler.LOGGER.action("rca.buffer-pool.miss")
+        return np.empty(shape, dtype=self._dtype)
+
+    def release(self, buffer: NDArray) -> None:
+        with self._lock:
+            if buffer.shape == self._shape and len(self._free) < self._size:
+                self._free.append(buffer)
@@ -10,6 +10,15 @@ class RemoteControlledAreaProtocol(Protocol):
 
     Any class matching this interface can be used as a RCA, regardless of inheritance.
     Implementing classes must define the required methods and properties to enable RCA interaction.
+
+    Optional members, looked up by the schedulers when present:
+
+    - ``bottom_up`` (bool): True when :attr:`img_cols_rows` returns its rows bottom-up
+      (OpenGL order). The encoder then performs the vertical flip instead of the backend.
+    - ``buffer_pool`` (:class:`CaptureBufferPool` or None): pool the captured images are
+      taken from. The scheduler releases each image to it once its encoding is done.
+    - ``release()``: free the resources held for capturing. Called when the scheduler
+      is closed.
     """
 
     @property
@@ -1,19 +1,39 @@
+from __future__ import annotations
+
 import json
+import logging
 
 import vtkmodules.vtkRenderingOpenGL2  # noqa
 from packaging.version import Version
 from trame_common.utils import profiler
-from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 from vtkmodules.vtkCommonCore import vtkCommand, vtkVersion
 from vtkmodules.vtkRenderingCore import vtkRenderWindow, vtkWindowToImageFilter
 from vtkmodules.vtkWebCore import vtkRemoteInteractionAdapter
 
+from .buffer_pool import CaptureBufferPool
+from .vtk_readback import VtkPboReadback, is_async_readback_supported
+
+logger = logging.getLogger(__name__)
 
 VTK_NEED_RESIZE_EVENT = Version(vtkVersion().vtk_version) < Version("9.5")
 
 
 class VtkRemoteControlledArea:
-    def __init__(self, vtk_render_window: vtkRenderWindow):
+    def __init__(
+        self,
+        vtk_render_window: vtkRenderWindow,
+        *,
+        bottom_up: bool = False,
+        async_readback: bool = False,
+        capture_buffers: int = 0,
+    ):
+        self._bottom_up = bottom_up
+        self._async_readback = async_readback
+        self._pbo_readback = None
+        self._buffer_pool = (
+            CaptureBufferPool(capture_buffers) if capture_buffers > 0 else None
+        )
         self._timer_render = profiler.Timer("rca.vtk.render")
         self._timer_capture = profiler.Timer("rca.vtk.capture")
         self._vtk_render_window = vtk_render_window
@@ -32,17 +52,91 @@ class VtkRemoteControlledArea:
     def img_cols_rows(self):
         self._render()
         with self._timer_capture:
-            self._window_to_image.Modified()
-            self._window_to_image.Update()
-
-            image_data = self._window_to_image.GetOutput()
-            rows, cols, _ = image_data.GetDimensions()
-            scalars = image_data.GetPointData().GetScalars()
-            np_image = vtk_to_numpy(scalars)
-            np_image = np_image.reshape((cols, rows, -1))
-            np_image[:] = np_image[::-1, :, :]
+            np_image = None
+            if self._async_readback:
+                np_image = self._capture_async()
+            if np_image is None and self._buffer_pool is not None:
+                np_image = self._capture_pixels()
+            if np_image is None:
+                np_image = self._capture_filter()
+
+            cols, rows, _ = np_image.shape
+            if not self._bottom_up:
+                np_image[:] = np_image[::-1, :, :]
             return np_image, cols, rows
 
+    def _capture_filter(self):
+        self._window_to_image.Modified()
+        self._window_to_image.Update()
+
+        image_data = self._window_to_image.GetOutput()
+        rows, cols, _ = image_data.GetDimensions()
+        scalars = image_data.GetPointData().GetScalars()
+        np_image = vtk_to_numpy(scalars)
+        return np_image.reshape((cols, rows, -1))
+
+    def _capture_pixels(self):
+        # Read straight into a pooled buffer rather than a new filter output.
+        # Equivalent to the filter as long as it keeps a scale of 1: FixBoundary only
+        # matters when the filter magnifies the window by tiling several renders.
+        cols, rows = self._vtk_render_window.GetSize()
+        np_image = self._buffer_pool.acquire((rows, cols, 3))
+        vtk_image = numpy_to_vtk(np_image.reshape((-1, 3)), deep=False)
+        self._vtk_render_window.GetPixelData(0, 0, cols - 1, rows - 1, 0, vtk_image, 0)
+        return np_image
+
+    def _capture_async(self):
+        if self._pbo_readback is None:
+            if not is_async_readback_supported(self._vtk_render_window):
+                logger.info(
+                    "Asynchronous readback - NOT AVAILABLE (software rendering)"
+                )
+                self._async_readback = False
+                return None
+            self._pbo_readback = VtkPboReadback(
+                self._vtk_render_window, self._buffer_pool
+            )
+
+        try:
+            return self._pbo_readback.capture()
+        except RuntimeError as e:
+            logger.warning("Asynchronous readback - DISABLED (%s)", e)
+            self.async_readback = False
+            return None
+
+    def release(self):
+        """Free the GPU resources held for capturing"""
+        if self._pbo_readback is not None:
+            self._pbo_readback.release()
+            self._pbo_readback = None
+
+    @property
+    def buffer_pool(self) -> CaptureBufferPool | None:
+        """
+        Pool the captured images come from, if any. Release each image back to it
+        once it is no longer needed so its memory can be reused by a later capture.
+        """
+        return self._buffer_pool
+
+    @property
+    def async_readback(self) -> bool:
+        """True while captures go through the double-buffered PBO readback"""
+        return self._async_readback
+
+    @async_readback.setter
+    def async_readback(self, value: bool):
+        self._async_readback = value
+        if not value:
+            self.release()
+
+    @property
+    def bottom_up(self) -> bool:
+        """
+        True when img_cols_rows hands over the OpenGL buffer as-is (first row at the
+        bottom) and leaves the vertical flip to the encoder or the client.
+        """
+        return self._bottom_up
+
     @property
     def render_window(self):
         self._render()
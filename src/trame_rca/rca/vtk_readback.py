@@ -0,0 +1,170 @@
+import logging
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from vtkmodules.util.vtkConstants import VTK_UNSIGNED_CHAR
+from vtkmodules.vtkRenderingCore import vtkRenderWindow
+from vtkmodules.vtkRenderingOpenGL2 import (
+    vtkOpenGLFramebufferObject,
+    vtkPixelBufferObject,
+)
+
+from .buffer_pool import CaptureBufferPool
+
+logger = logging.getLogger(__name__)
+
+GL_READ_FRAMEBUFFER = 0x8CA8
+GL_DRAW_FRAMEBUFFER = 0x8CA9
+GL_COLOR_BUFFER_BIT = 0x4000
+GL_NEAREST = 0x2600
+GL_UNSIGNED_BYTE = 0x1401
+GL_RGB = 0x1907
+
+# Contexts for which a PBO readback is just a memcpy on the CPU
+SOFTWARE_WINDOWS = ("vtkOSOpenGLRenderWindow",)
+SOFTWARE_RENDERERS = ("llvmpipe", "softpipe", "swrast", "software rasterizer")
+
+# A pending readback older than this is not part of a continuous frame stream
+# and would show a stale frame, so it is dropped in favor of a synchronous read.
+MAX_PENDING_AGE_S = 0.25
+
+
+def is_async_readback_supported(render_window: vtkRenderWindow) -> bool:
+    if render_window.GetClassName() in SOFTWARE_WINDOWS:
+        return False
+
+    if not hasattr(render_window, "GetRenderFramebuffer"):
+        return False
+
+    capabilities = (render_window.ReportCapabilities() or "").lower()
+    return not any(name in capabilities for name in SOFTWARE_RENDERERS)
+
+
+class VtkPboReadback:
+    """
+    Double-buffered GPU readback of a render window through pixel buffer objects.
+
+    Each capture starts an asynchronous read of the current frame into a PBO and
+    maps the PBO filled by the previous capture, so the transfer of frame N overlaps
+    the rendering of frame N+1. This delays the frames by one capture while they
+    flow continuously; the first capture after a pause or a resize is synchronous
+    and its frame is handed over again by the next capture.
+
+    Pixels are read from the render framebuffer (back buffer), resolved first when
+    multisampled, like vtkWindowToImageFilter with ReadFrontBufferOff. They come in
+    OpenGL row order (bottom-up).
+    """
+
+    def __init__(
+        self,
+        render_window: vtkRenderWindow,
+        buffer_pool: Optional[CaptureBufferPool] = None,
+    ):
+        self._render_window = render_window
+        self._buffer_pool = buffer_pool
+        self._pbos = [vtkPixelBufferObject(), vtkPixelBufferObject()]
+        for pbo in self._pbos:
+            pbo.SetContext(render_window)
+        self._resolve_framebuffer = None
+        self._next_pbo = 0
+        self._pending = None
+        self._pending_delivered = False
+
+    @property
+    def pending(self) -> bool:
+        """True when the last rendered frame has not been handed over yet"""
+        return self._pending is not None and not self._pending_delivered
+
+    def capture(self) -> NDArray:
+        """
+        Start the readback of the current frame and return a (height, width, 3) array
+        holding the previous frame, or the current one when the readback is synchronous.
+        """
+        cols, rows = self._render_window.GetSize()
+        current = (self._start(cols, rows), cols, rows, perf_counter())
+        previous, self._pending = self._pending, current
+        self._pending_delivered = (
+            previous is None
+            or previous[1:3] != (cols, rows)
+            or current[3] - previous[3] > MAX_PENDING_AGE_S
+        )
+        if self._pending_delivered:
+            # Synchronous read. The frame stays pending so the next capture can be
+            # overlapped, at the cost of handing this frame over a second time.
+            previous = current
+
+        pbo, cols, rows, _ = previous
+        return self._map(pbo, cols, rows)
+
+    def release(self):
+        """Free the GPU buffers. The readback can still be used afterward."""
+        self._pending = None
+        self._pending_delivered = False
+        for pbo in self._pbos:
+            pbo.ReleaseMemory()
+        if self._resolve_framebuffer is not None:
+            self._resolve_framebuffer.ReleaseGraphicsResources(self._render_window)
+            self._resolve_framebuffer = None
+
+    def _get_read_framebuffer(self, cols: int, rows: int):
+        framebuffer = self._render_window.GetRenderFramebuffer()
+        if not framebuffer.GetMultiSamples():
+            return framebuffer
+
+        # Multisampled buffers can not be read directly, resolve them first
+        if self._resolve_framebuffer is None:
+            self._resolve_framebuffer = vtkOpenGLFramebufferObject()
+            self._resolve_framebuffer.SetContext(self._render_window)
+
+        resolve = self._resolve_framebuffer
+        if tuple(resolve.GetLastSize()) != (cols, rows):
+            resolve.SaveCurrentBindingsAndBuffers()
+            if resolve.GetNumberOfColorAttachments():
+                resolve.Resize(cols, rows)
+            else:
+                resolve.PopulateFramebuffer(
+                    cols, rows, True, 1, VTK_UNSIGNED_CHAR, False, 0, 0
+                )
+            resolve.RestorePreviousBindingsAndBuffers()
+
+        extent = [0, cols - 1, 0, rows - 1]
+        framebuffer.Bind(GL_READ_FRAMEBUFFER)
+        framebuffer.ActivateReadBuffer(0)
+        resolve.Bind(GL_DRAW_FRAMEBUFFER)
+        resolve.ActivateDrawBuffer(0)
+        vtkOpenGLFramebufferObject.Blit(extent, extent, GL_COLOR_BUFFER_BIT, GL_NEAREST)
+        return resolve
+
+    def _start(self, cols: int, rows: int) -> vtkPixelBufferObject:
+        pbo = self._pbos[self._next_pbo]
+        self._next_pbo = (self._next_pbo + 1) % len(self._pbos)
+
+        self._render_window.MakeCurrent()
+        render_framebuffer = self._render_window.GetRenderFramebuffer()
+        render_framebuffer.SaveCurrentBindingsAndBuffers()
+        framebuffer = self._get_read_framebuffer(cols, rows)
+        framebuffer.Bind(GL_READ_FRAMEBUFFER)
+        framebuffer.ActivateReadBuffer(0)
+        vtkOpenGLFramebufferObject.Download(
+            [0, cols - 1, 0, rows - 1],
+            VTK_UNSIGNED_CHAR,
+            3,
+            GL_UNSIGNED_BYTE,
+            GL_RGB,
+            pbo,
+        )
+        render_framebuffer.RestorePreviousBindingsAndBuffers()
+        return pbo
+
+    def _map(self, pbo: vtkPixelBufferObject, cols: int, rows: int) -> NDArray:
+        shape = (rows, cols, 3)
+        if self._buffer_pool is None:
+            np_image = np.empty(shape, dtype=np.uint8)
+        else:
+            np_image = self._buffer_pool.acquire(shape)
+        self._render_window.MakeCurrent()
+        if not pbo.Download2D(VTK_UNSIGNED_CHAR, np_image, [cols, rows], 3, [0, 0]):
+            raise RuntimeError("Unable to map pixel buffer object")
+        return np_image
@@ -99,6 +99,10 @@ class RcaImageRenderScheduler:
         for task in [self._render_task, self._render_quality_task, self._push_task]:
             await task
 
+        release = getattr(self._rca, "release", None)
+        if release is not None:
+            release()
+
     def schedule_render(self):
         asynchronous.create_task(self.async_schedule_render())
 
@@ -127,17 +131,20 @@ class RcaImageRenderScheduler:
         while not self._is_closing:
             quality = await self._render_quality_queue.get()
             np_img, cols, rows = self._rca.img_cols_rows
-            await self._push_queue.put(
-                wrap_future(
-                    self._encode_pool.submit(
-                        self._rca_encoder.encode,
-                        np_img,
-                        cols,
-                        rows,
-                        quality,
-                    )
-                )
+            future = self._encode_pool.submit(
+                self._rca_encoder.encode,
+                np_img,
+                cols,
+                rows,
+                quality,
+                getattr(self._rca, "bottom_up", False),
             )
+            buffer_pool = getattr(self._rca, "buffer_pool", None)
+            if buffer_pool is not None:
+                future.add_done_callback(
+                    lambda _, pool=buffer_pool, img=np_img: pool.release(img)
+                )
+            await self._push_queue.put(wrap_future(future))
 
     async def _push(self):
         while not self._is_closing:
@@ -75,6 +75,7 @@ class RcaVideoRenderScheduler:
         await sleep(1)
         await self._render_task
         self._rca_encoder.release()
+        self._rca.release()
 
     def schedule_render(self):
         self._render_requested = True
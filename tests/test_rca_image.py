@@ -2,16 +2,19 @@ import asyncio
 import os
 import sys
 import time
+from io import BytesIO
 from multiprocessing import Pool
 from pathlib import Path
 from unittest.mock import MagicMock
 
 
+import numpy as np
 import pytest
 from PIL import Image
 from trame_rca.encoders import RcaImageEncoder
 from trame_rca.schedulers import RcaImageRenderScheduler
 from trame_rca.rca import VtkRemoteControlledArea
+from trame_rca.rca.vtk_readback import VtkPboReadback, is_async_readback_supported
 
 
 if os.environ.get("CI") is not None and sys.platform != "linux":
@@ -34,6 +37,92 @@ def test_a_view_can_be_encoded_to_format(a_render_window, tmpdir, img_format):
     assert im
 
 
+@pytest.mark.parametrize("img_format", ["png", "webp", "jpeg", "turbo-jpeg"])
+def test_bottom_up_capture_is_flipped_by_the_encoder(a_render_window, img_format):
+    encoder = RcaImageEncoder(img_format)
+    flipped = VtkRemoteControlledArea(a_render_window).img_cols_rows
+    bottom_up = VtkRemoteControlledArea(a_render_window, bottom_up=True).img_cols_rows
+    assert (flipped[0][::-1] == bottom_up[0]).all()
+
+    expected, *_ = encoder.encode(*flipped, 100)
+    img, *_ = encoder.encode(*bottom_up, 100, bottom_up=True)
+    decoded = np.asarray(Image.open(BytesIO(img)), dtype=np.int16)
+    decoded_expected = np.asarray(Image.open(BytesIO(expected)), dtype=np.int16)
+    assert decoded.shape == decoded_expected.shape
+    # Lossy encoders may place block boundaries differently when flipping themselves
+    assert np.abs(decoded - decoded_expected).mean() < 1
+    assert np.abs(decoded - flipped[0]).mean() < 2
+
+
+def test_async_readback_falls_back_to_filter_on_software_rendering(a_render_window):
+    expected, cols, rows = VtkRemoteControlledArea(a_render_window).img_cols_rows
+    rca = VtkRemoteControlledArea(a_render_window, async_readback=True)
+    np_image, *size = rca.img_cols_rows
+
+    if not is_async_readback_supported(a_render_window):
+        assert not rca.async_readback
+        assert np.array_equal(np_image, expected)
+    assert np_image.shape == expected.shape
+    assert size == [cols, rows]
+
+
+@pytest.mark.parametrize("multi_samples", [0, 4])
+def test_async_readback_matches_filter_capture(
+    a_render_window, monkeypatch, multi_samples
+):
+    monkeypatch.setattr(
+        "trame_rca.rca.vtk_rca.is_async_readback_supported", lambda _: True
+    )
+    a_render_window.SetMultiSamples(multi_samples)
+    expected, *_ = VtkRemoteControlledArea(a_render_window).img_cols_rows
+    rca = VtkRemoteControlledArea(a_render_window, async_readback=True)
+    np_image, *_ = rca.img_cols_rows
+
+    assert rca.async_readback
+    assert np.array_equal(np_image, expected)
+
+    rca.async_readback = False
+    assert rca._pbo_readback is None
+
+
+def test_pbo_readback_hands_over_the_previous_frame(a_render_window):
+    readback = VtkPboReadback(a_render_window)
+    a_render_window.Render()
+    first = readback.capture()
+    assert first.shape == (300, 300, 3)
+    assert not readback.pending
+
+    a_render_window.GetRenderers().GetFirstRenderer().GetActiveCamera().Azimuth(90)
+    a_render_window.Render()
+    assert np.array_equal(readback.capture(), first)
+    assert readback.pending
+
+    a_render_window.Render()
+    assert not np.array_equal(readback.capture(), first)
+    readback.release()
+    assert not readback.pending
+
+
+def test_capture_buffers_are_reused_once_released(a_render_window):
+    expected, *_ = VtkRemoteControlledArea(a_render_window).img_cols_rows
+    rca = VtkRemoteControlledArea(a_render_window, capture_buffers=2)
+
+    first, *_ = rca.img_cols_rows
+    assert np.array_equal(first, expected)
+    rca.buffer_pool.release(first)
+    second, *_ = rca.img_cols_rows
+    assert second is first
+    third, *_ = rca.img_cols_rows
+    assert third is not first
+    assert rca.buffer_pool.stats == dict(hits=1, misses=2, free=0)
+
+    a_render_window.SetSize(200, 100)
+    rca.buffer_pool.release(second)
+    resized, *_ = rca.img_cols_rows
+    assert resized.shape == (100, 200, 3)
+    assert rca.buffer_pool.stats["misses"] == 3
+
+
 @pytest.mark.parametrize("img_format", ["jpeg", "png", "avif", "webp"])
 def test_np_encode_can_be_done_using_multiprocess(a_render_window, img_format):
     encoder = RcaImageEncoder(img_format)
@@ -150,6 +239,42 @@ async def test_groups_close_request_render_together(
         await scheduler.close()
 
 
+@pytest.mark.asyncio
+async def test_scheduler_releases_capture_buffers_after_encoding(a_render_window):
+    rca = VtkRemoteControlledArea(a_render_window, capture_buffers=2)
+    scheduler = RcaImageRenderScheduler(
+        rca,
+        push_callback=MagicMock(),
+        target_fps=20,
+    )
+
+    try:
+        for _ in range(3):
+            await scheduler.async_schedule_render()
+            await asyncio.sleep(0.5)
+        stats = rca.buffer_pool.stats
+        assert stats["hits"] > 0
+        # every buffer handed out came back once its encoding was done
+        assert stats["free"] == min(stats["misses"], 2)
+    finally:
+        await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_close_releases_async_readback(a_render_window, monkeypatch):
+    monkeypatch.setattr(
+        "trame_rca.rca.vtk_rca.is_async_readback_supported", lambda _: True
+    )
+    rca = VtkRemoteControlledArea(a_render_window, async_readback=True)
+    scheduler = RcaImageRenderScheduler(rca, push_callback=MagicMock(), target_fps=20)
+    await scheduler.async_schedule_render()
+    await asyncio.sleep(0.5)
+    assert rca._pbo_readback is not None
+
+    await scheduler.close()
+    assert rca._pbo_readback is None
+
+
 @pytest.mark.parametrize("encoder", list(RcaImageEncoder))
 def test_scheduler_is_compatible_with_string_encoder_format(encoder, a_render_window):
     RcaImageRenderScheduler(